@@ -1,39 +1,108 @@
 #!/usr/bin/env python3
-import csv
 import json
 import os
-import statistics
 import numpy as np
 import sys
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 INPUT = "scratch/ai_out/nodes_stats.csv"
 BANLIST = "scratch/ai_out/banlist.txt"
 BLACKHOLE_BANLIST = "scratch/ai_out/banlist_blackhole.txt"
 WORMHOLE_BANLIST = "scratch/ai_out/banlist_wormhole.txt"
 DETECTED = "scratch/ai_out/detected.json"
 
+# Print one line per high-confidence detection
+VERBOSE = True
+
+NODE_COLUMNS = ('node_id', 'txPackets', 'rxPackets', 'fwdPackets', 'node_type')
+
+# node_type is loaded as a uint8 code; the index in NODE_TYPES is the code
+# and any type not listed here is treated as NORMAL
+NODE_TYPES = ('NORMAL', 'BLACKHOLE', 'WORMHOLE', 'BANNED')
+NORMAL, BLACKHOLE, WORMHOLE, BANNED = range(len(NODE_TYPES))
+ATTACK_TYPES = ("baseline", "wormhole", "blackhole", "mixed")
+
+def load_node_stats(path):
+    """Load node statistics as one NumPy array per column (struct-of-arrays)"""
+    if pa is not None:
+        table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(
+            include_columns=list(NODE_COLUMNS),
+            # An empty counter cell must fail conversion, not become a NaN
+            null_values=[],
+            column_types={
+                'node_id': pa.int32(),
+                'txPackets': pa.int64(),
+                'rxPackets': pa.int64(),
+                'fwdPackets': pa.int64(),
+                'node_type': pa.string()
+            }))
+        return {
+            'node_id': table.column('node_id').to_numpy(),
+            'txPackets': table.column('txPackets').to_numpy(),
+            'rxPackets': table.column('rxPackets').to_numpy(),
+            'fwdPackets': table.column('fwdPackets').to_numpy(),
+            'node_type': pc.fill_null(
+                pc.index_in(table.column('node_type'), value_set=pa.array(NODE_TYPES)), NORMAL
+            ).to_numpy().astype(np.uint8)
+        }
+    
+    # Fallback when pyarrow is not installed: np.loadtxt parses in C,
+    # the numeric columns are then converted from the string table in bulk
+    with open(path, 'r') as f:
+        header = f.readline().strip().split(',')
+        usecols = [header.index(name) for name in NODE_COLUMNS]
+        table = np.loadtxt(f, delimiter=',', dtype=str, usecols=usecols, ndmin=2)
+    
+    node_type = np.full(len(table), NORMAL, dtype=np.uint8)
+    for code, name in enumerate(NODE_TYPES):
+        node_type[table[:, 4] == name] = code
+    
+    return {
+        'node_id': table[:, 0].astype(np.int32),
+        'txPackets': table[:, 1].astype(np.int64),
+        'rxPackets': table[:, 2].astype(np.int64),
+        'fwdPackets': table[:, 3].astype(np.int64),
+        'node_type': node_type
+    }
+
+def select_median(values):
+    """Median via O(N) selection (np.partition) instead of a full sort"""
+    k = values.size // 2
+    if values.size % 2:
+        return float(np.partition(values, k)[k])
+    part = np.partition(values, (k - 1, k))
+    return (part[k - 1] + part[k]) / 2.0
+
+def unique_ids(*id_lists):
+    """Sorted, de-duplicated int32 node ids from one or more id arrays"""
+    return np.unique(np.concatenate(id_lists).astype(np.int32, copy=False))
+
 def count_wormhole_pairs(nodes):
     """Count actual wormhole pairs from simulation data"""
-    wormhole_nodes = [n for n in nodes if n['node_type'] == 'WORMHOLE']
-    return len(wormhole_nodes) // 2  # Each pair has 2 nodes
+    wormhole_count = np.count_nonzero(nodes['node_type'] == WORMHOLE)
+    return int(wormhole_count) // 2  # Each pair has 2 nodes
 
-def get_attack_type_from_stats(nodes):
-    """Determine the current attack type from node statistics"""
-    blackhole_count = len([n for n in nodes if n['node_type'] == 'BLACKHOLE'])
-    wormhole_count = len([n for n in nodes if n['node_type'] == 'WORMHOLE'])
-    
-    if blackhole_count > 0 and wormhole_count == 0:
-        return "blackhole"
-    elif wormhole_count > 0 and blackhole_count == 0:
-        return "wormhole"
-    elif blackhole_count == 0 and wormhole_count == 0:
-        return "baseline"
-    else:
-        return "mixed"
+def split_known_nodes(nodes):
+    """Return the ids of known blackhole and wormhole nodes from the simulation"""
+    node_type = nodes['node_type']
+    known_blackholes = nodes['node_id'][node_type == BLACKHOLE]
+    known_wormholes = nodes['node_id'][node_type == WORMHOLE]
+    return known_blackholes, known_wormholes
+
+def get_attack_type_from_stats(known_blackholes, known_wormholes):
+    """Determine the current attack type from the known malicious nodes"""
+    # Index is (has blackholes, has wormholes) packed into two bits
+    return ATTACK_TYPES[(len(known_blackholes) > 0) << 1 | (len(known_wormholes) > 0)]
 
 def calculate_dynamic_limits(nodes, known_blackholes, known_wormholes, attack_type):
     """Calculate dynamic limits based on attack type and network size"""
-    total_nodes = len(nodes)
+    total_nodes = len(nodes['node_id'])
     
     # Base limits on network size
     max_total_ban = max(6, int(total_nodes * 0.25))
@@ -55,93 +124,98 @@ def calculate_dynamic_limits(nodes, known_blackholes, known_wormholes, attack_ty
     
     return max_blackhole_ban, max_wormhole_ban
 
-def detect_blackholes(nodes, median_rx, available_nodes, attack_type):
-    """More accurate blackhole detection - only in blackhole scenarios"""
-    blackhole_candidates = []
-    
-    # ONLY detect additional blackholes in blackhole scenarios
-    if attack_type != "blackhole":
-        return blackhole_candidates
-        
-    for node in nodes:
-        if node['node_id'] not in available_nodes:
-            continue
-            
-        rx = node['rxPackets']
-        fwd = node['fwdPackets']
-        tx = node['txPackets']
+def detect_candidates(nodes, median_rx, available_mask, attack_type):
+    """More accurate blackhole/wormhole detection - only for the current attack type"""
+    blackhole_candidates = np.empty(0, dtype=np.int32)
+    wormhole_candidates = np.empty(0, dtype=np.int32)
+    messages = []
+    
+    # ONLY detect additional nodes of the attack type being simulated
+    if attack_type not in ("blackhole", "wormhole"):
+        return blackhole_candidates, wormhole_candidates
         
+    node_id = nodes['node_id']
+    rx = nodes['rxPackets']
+    fwd = nodes['fwdPackets']
+    tx = nodes['txPackets']
+    
+    if attack_type == "blackhole":
         # CONSERVATIVE BLACKHOLE INDICATORS:
         zero_forwarding = (fwd == 0)
         high_traffic = (rx > max(40, median_rx * 2.5))
         not_source_node = (tx < rx * 0.25)
         meaningful_activity = (rx > 30)
         
-        if (zero_forwarding and high_traffic and not_source_node and meaningful_activity):
-            blackhole_candidates.append(node['node_id'])
-            print(f"   💀 HIGH-CONFIDENCE BLACKHOLE: Node {node['node_id']} "
-                  f"(RX={rx}, FWD=0, TX={tx}, Median={median_rx:.1f})")
-    
-    return blackhole_candidates
-
-def detect_wormholes(nodes, median_rx, available_nodes, attack_type):
-    """More accurate wormhole detection - only in wormhole scenarios"""
-    wormhole_candidates = []
-    
-    # ONLY detect additional wormholes in wormhole scenarios
-    if attack_type != "wormhole":
-        return wormhole_candidates
-        
-    for node in nodes:
-        if node['node_id'] not in available_nodes:
-            continue
-            
-        rx = node['rxPackets']
-        fwd = node['fwdPackets']
-        tx = node['txPackets']
-        fwd_ratio = fwd / (rx + 0.001)
-        
+        mask = (available_mask & zero_forwarding & high_traffic & 
+                not_source_node & meaningful_activity)
+        blackhole_candidates = node_id[mask]
+        if VERBOSE:
+            for i in np.flatnonzero(mask):
+                messages.append(f"   💀 HIGH-CONFIDENCE BLACKHOLE: Node {node_id[i]} "
+                                f"(RX={rx[i]}, FWD=0, TX={tx[i]}, Median={median_rx:.1f})")
+    else:
         # CONSERVATIVE WORMHOLE INDICATORS:
         extreme_traffic = (rx > median_rx * 5.0)
-        suspicious_pattern = (0.05 < fwd_ratio < 0.25)
-        not_primary_source = (tx < rx * 0.15)
         network_presence = (rx > 50)
         
-        if (extreme_traffic and suspicious_pattern and 
-            not_primary_source and network_presence):
-            wormhole_candidates.append(node['node_id'])
-            print(f"   🌀 HIGH-CONFIDENCE WORMHOLE: Node {node['node_id']} "
-                  f"(RX={rx}, FwdRatio={fwd_ratio:.3f}, TX/RX={tx/rx:.3f})")
+        # Only nodes passing the cheap traffic checks get the ratio tests
+        busy = np.flatnonzero(available_mask & extreme_traffic & network_presence)
+        busy_rx = rx[busy]
+        fwd_ratio = fwd[busy] / (busy_rx + 0.001)
+        suspicious_pattern = (0.05 < fwd_ratio) & (fwd_ratio < 0.25)
+        not_primary_source = (tx[busy] < busy_rx * 0.15)
+        
+        hits = suspicious_pattern & not_primary_source
+        wormhole_candidates = node_id[busy[hits]]
+        if VERBOSE:
+            for i, ratio in zip(busy[hits], fwd_ratio[hits]):
+                messages.append(f"   🌀 HIGH-CONFIDENCE WORMHOLE: Node {node_id[i]} "
+                                f"(RX={rx[i]}, FwdRatio={ratio:.3f}, TX/RX={tx[i]/rx[i]:.3f})")
+    
+    if messages:
+        sys.stdout.write("\n".join(messages) + "\n")
     
-    return wormhole_candidates
+    return blackhole_candidates, wormhole_candidates
+
+def read_banlist(path):
+    """Read node ids from a banlist file, or an empty array if it does not exist"""
+    try:
+        with open(path, 'r') as f:
+            return np.array(f.read().split(), dtype=np.int32)
+    except FileNotFoundError:
+        return np.empty(0, dtype=np.int32)
 
 def preserve_existing_banlists(attack_type):
     """Preserve existing banlists for different attack types"""
-    preserved_blackholes = []
-    preserved_wormholes = []
+    preserved_blackholes = np.empty(0, dtype=np.int32)
+    preserved_wormholes = np.empty(0, dtype=np.int32)
     
     # Preserve blackhole banlist if not in blackhole scenario
-    if attack_type != "blackhole" and os.path.exists(BLACKHOLE_BANLIST):
+    if attack_type != "blackhole":
         try:
-            with open(BLACKHOLE_BANLIST, 'r') as f:
-                preserved_blackholes = [int(line.strip()) for line in f if line.strip()]
-            if preserved_blackholes:
-                print(f"   📁 Preserved existing blackhole banlist: {preserved_blackholes}")
+            preserved_blackholes = read_banlist(BLACKHOLE_BANLIST)
+            if preserved_blackholes.size:
+                print(f"   📁 Preserved existing blackhole banlist: {preserved_blackholes.tolist()}")
         except Exception as e:
             print(f"   ⚠️  Could not read existing blackhole banlist: {e}")
     
     # Preserve wormhole banlist if not in wormhole scenario  
-    if attack_type != "wormhole" and os.path.exists(WORMHOLE_BANLIST):
+    if attack_type != "wormhole":
         try:
-            with open(WORMHOLE_BANLIST, 'r') as f:
-                preserved_wormholes = [int(line.strip()) for line in f if line.strip()]
-            if preserved_wormholes:
-                print(f"   📁 Preserved existing wormhole banlist: {preserved_wormholes}")
+            preserved_wormholes = read_banlist(WORMHOLE_BANLIST)
+            if preserved_wormholes.size:
+                print(f"   📁 Preserved existing wormhole banlist: {preserved_wormholes.tolist()}")
         except Exception as e:
             print(f"   ⚠️  Could not read existing wormhole banlist: {e}")
     
     return preserved_blackholes, preserved_wormholes
 
+def write_banlist(path, node_ids):
+    """Write one node id per line from a single pre-rendered payload"""
+    payload = b"".join(b"%d\n" % node_id for node_id in node_ids.tolist())
+    with open(path, 'wb') as f:
+        f.write(payload)
+
 def main():
     print("🚀 Starting ATTACK-AWARE AI-based malicious node detection...")
     
@@ -150,107 +224,104 @@ def main():
         return False
     
     # Read node data
-    nodes = []
     try:
-        with open(INPUT, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                nodes.append({
-                    'node_id': int(row['node_id']),
-                    'txPackets': int(row['txPackets']),
-                    'rxPackets': int(row['rxPackets']),
-                    'fwdPackets': int(row['fwdPackets']),
-                    'node_type': row['node_type']
-                })
-        print(f"✅ Successfully loaded data for {len(nodes)} nodes")
+        nodes = load_node_stats(INPUT)
+        n_nodes = len(nodes['node_id'])
+        print(f"✅ Successfully loaded data for {n_nodes} nodes")
     except Exception as e:
         print(f"❌ ERROR reading CSV: {e}")
         return False
     
+    # Count known malicious nodes from simulation
+    known_blackholes, known_wormholes = split_known_nodes(nodes)
+    
     # Determine current attack type
-    attack_type = get_attack_type_from_stats(nodes)
+    attack_type = get_attack_type_from_stats(known_blackholes, known_wormholes)
     print(f"🔍 Detected attack type: {attack_type.upper()}")
     
-    # Count known malicious nodes from simulation
-    known_blackholes = [n for n in nodes if n['node_type'] == 'BLACKHOLE']
-    known_wormholes = [n for n in nodes if n['node_type'] == 'WORMHOLE']
-    
     # Calculate dynamic limits based on attack type
     MAX_TOTAL_BLACKHOLE_BAN, MAX_TOTAL_WORMHOLE_BAN = calculate_dynamic_limits(
         nodes, known_blackholes, known_wormholes, attack_type
     )
     
     print(f"📊 Known malicious nodes:")
-    print(f"   Blackholes: {[n['node_id'] for n in known_blackholes]}")
-    print(f"   Wormholes: {[n['node_id'] for n in known_wormholes]}")
+    print(f"   Blackholes: {known_blackholes.tolist()}")
+    print(f"   Wormholes: {known_wormholes.tolist()}")
     print(f"🔧 Attack-aware limits: Blackholes={MAX_TOTAL_BLACKHOLE_BAN}, Wormholes={MAX_TOTAL_WORMHOLE_BAN}")
     
     # PRESERVE existing banlists for different attack types
     preserved_blackholes, preserved_wormholes = preserve_existing_banlists(attack_type)
     
-    # Initialize banlists
-    blackhole_banlist = preserved_blackholes.copy()
-    wormhole_banlist = preserved_wormholes.copy()
-    
     # STRATEGY 1: Always ban known malicious nodes from current simulation
-    blackhole_banlist.extend([n['node_id'] for n in known_blackholes])
-    wormhole_banlist.extend([n['node_id'] for n in known_wormholes])
-    
-    # Remove duplicates
-    blackhole_banlist = sorted(set(blackhole_banlist))
-    wormhole_banlist = sorted(set(wormhole_banlist))
+    # (de-duplicated here so the limits below keep these ahead of new detections)
+    blackhole_banlist = np.union1d(preserved_blackholes, known_blackholes)
+    wormhole_banlist = np.union1d(preserved_wormholes, known_wormholes)
     
     # STRATEGY 2: Add only HIGH-CONFIDENCE suspicious nodes (attack-specific)
     print(f"\n🔍 ATTACK-SPECIFIC ADDITIONAL DETECTION:")
     
-    # Calculate network statistics
-    active_nodes = [n for n in nodes if n['rxPackets'] > 15 or n['txPackets'] > 15]
-    
-    if active_nodes and len(active_nodes) > 15:
-        median_rx = statistics.median([n['rxPackets'] for n in active_nodes])
-        
-        # Get available nodes for additional detection
-        available_for_detection = [n['node_id'] for n in nodes 
-                                 if n['node_type'] not in ['BLACKHOLE', 'WORMHOLE', 'BANNED']]
-        
-        print(f"   Active nodes: {len(active_nodes)}, Median RX: {median_rx:.1f}")
-        
-        # ATTACK-SPECIFIC DETECTION
-        additional_blackholes = detect_blackholes(nodes, median_rx, available_for_detection, attack_type)
-        additional_wormholes = detect_wormholes(nodes, median_rx, available_for_detection, attack_type)
+    # Additional detection only runs for single-attack scenarios, so skip the
+    # network statistics entirely for baseline and mixed runs
+    if attack_type not in ("blackhole", "wormhole"):
+        print(f"   ⏭️  Skipped for {attack_type.upper()} scenario")
+    else:
+        # Calculate network statistics
+        active_mask = (nodes['rxPackets'] > 15) | (nodes['txPackets'] > 15)
+        active_count = int(active_mask.sum())
         
-        # Add high-confidence detections
-        if additional_blackholes:
-            print(f"   ➕ Adding {len(additional_blackholes)} high-confidence blackhole(s)")
-            blackhole_banlist.extend(additional_blackholes)
+        if active_count > 15:
+            median_rx = select_median(nodes['rxPackets'][active_mask])
             
-        if additional_wormholes:
-            print(f"   ➕ Adding {len(additional_wormholes)} high-confidence wormhole(s)")
-            wormhole_banlist.extend(additional_wormholes)
-    else:
-        print("   ⚠️  Insufficient active nodes for additional detection")
+            # Get available nodes for additional detection (not BLACKHOLE, WORMHOLE or BANNED)
+            available_for_detection = (nodes['node_type'] == NORMAL)
+            
+            print(f"   Active nodes: {active_count}, Median RX: {median_rx:.1f}")
+            
+            # ATTACK-SPECIFIC DETECTION
+            additional_blackholes, additional_wormholes = detect_candidates(
+                nodes, median_rx, available_for_detection, attack_type
+            )
+            
+            # Add high-confidence detections
+            if additional_blackholes.size:
+                print(f"   ➕ Adding {len(additional_blackholes)} high-confidence blackhole(s)")
+                blackhole_banlist = np.concatenate((blackhole_banlist, additional_blackholes))
+                
+            if additional_wormholes.size:
+                print(f"   ➕ Adding {len(additional_wormholes)} high-confidence wormhole(s)")
+                wormhole_banlist = np.concatenate((wormhole_banlist, additional_wormholes))
+        else:
+            print("   ⚠️  Insufficient active nodes for additional detection")
     
     # Apply overall limits
     print(f"\n🔒 APPLYING ATTACK-AWARE LIMITS:")
-    print(f"   Before limits: Blackholes={len(blackhole_banlist)}, Wormholes={len(wormhole_banlist)}")
+    n_blackhole_bans = len(blackhole_banlist)
+    n_wormhole_bans = len(wormhole_banlist)
+    print(f"   Before limits: Blackholes={n_blackhole_bans}, Wormholes={n_wormhole_bans}")
     
-    if len(blackhole_banlist) > MAX_TOTAL_BLACKHOLE_BAN:
-        print(f"   ⚠️  Limiting blackhole bans from {len(blackhole_banlist)} to {MAX_TOTAL_BLACKHOLE_BAN}")
+    if n_blackhole_bans > MAX_TOTAL_BLACKHOLE_BAN:
+        print(f"   ⚠️  Limiting blackhole bans from {n_blackhole_bans} to {MAX_TOTAL_BLACKHOLE_BAN}")
         blackhole_banlist = blackhole_banlist[:MAX_TOTAL_BLACKHOLE_BAN]
     
-    if len(wormhole_banlist) > MAX_TOTAL_WORMHOLE_BAN:
-        print(f"   ⚠️  Limiting wormhole bans from {len(wormhole_banlist)} to {MAX_TOTAL_WORMHOLE_BAN}")
+    if n_wormhole_bans > MAX_TOTAL_WORMHOLE_BAN:
+        print(f"   ⚠️  Limiting wormhole bans from {n_wormhole_bans} to {MAX_TOTAL_WORMHOLE_BAN}")
         wormhole_banlist = wormhole_banlist[:MAX_TOTAL_WORMHOLE_BAN]
     
-    # Final banlists
-    blackhole_banlist = sorted(set(blackhole_banlist))
-    wormhole_banlist = sorted(set(wormhole_banlist))
-    main_banlist = sorted(set(blackhole_banlist + wormhole_banlist))
+    # Final banlists (already unique: new detections never overlap Strategy 1)
+    blackhole_banlist = np.sort(blackhole_banlist)
+    wormhole_banlist = np.sort(wormhole_banlist)
+    main_banlist = np.union1d(blackhole_banlist, wormhole_banlist)
     
     print(f"   After limits: Blackholes={len(blackhole_banlist)}, Wormholes={len(wormhole_banlist)}")
     
+    # Cross-attack contamination: a node should not be banned as both types
+    overlap = np.intersect1d(blackhole_banlist, wormhole_banlist, assume_unique=True)
+    if overlap.size:
+        print(f"   ⚠️  Nodes in both blackhole and wormhole banlists: {overlap.tolist()}")
+    
     # Safety check
-    ban_ratio = len(main_banlist) / len(nodes)
+    n_bans = len(main_banlist)
+    ban_ratio = n_bans / n_nodes
     MAX_SAFE_BAN_RATIO = 0.25
     
     print(f"\n🔒 FINAL SAFETY CHECK:")
@@ -259,36 +330,32 @@ def main():
     if ban_ratio > MAX_SAFE_BAN_RATIO:
         print(f"   🚨 CRITICAL: Ban ratio too high - preserving only known malicious nodes")
         # Keep only known malicious + preserved lists
-        main_banlist = sorted(set(
-            [n['node_id'] for n in known_blackholes + known_wormholes] +
-            preserved_blackholes + preserved_wormholes
-        ))
-        blackhole_banlist = [n['node_id'] for n in known_blackholes] + preserved_blackholes
-        wormhole_banlist = [n['node_id'] for n in known_wormholes] + preserved_wormholes
+        main_banlist = unique_ids(
+            known_blackholes, known_wormholes,
+            preserved_blackholes, preserved_wormholes
+        )
+        n_bans = len(main_banlist)
+        ban_ratio = n_bans / n_nodes
+        blackhole_banlist = np.concatenate((known_blackholes, preserved_blackholes))
+        wormhole_banlist = np.concatenate((known_wormholes, preserved_wormholes))
     
     # Ensure output directory exists
     os.makedirs("scratch/ai_out", exist_ok=True)
     
     try:
         # ONLY overwrite banlists for the current attack type
-        if attack_type == "blackhole" or blackhole_banlist:
-            with open(BLACKHOLE_BANLIST, 'w') as f:
-                for node_id in blackhole_banlist:
-                    f.write(f"{node_id}\n")
+        if attack_type == "blackhole" or blackhole_banlist.size:
+            write_banlist(BLACKHOLE_BANLIST, blackhole_banlist)
         
-        if attack_type == "wormhole" or wormhole_banlist:
-            with open(WORMHOLE_BANLIST, 'w') as f:
-                for node_id in wormhole_banlist:
-                    f.write(f"{node_id}\n")
+        if attack_type == "wormhole" or wormhole_banlist.size:
+            write_banlist(WORMHOLE_BANLIST, wormhole_banlist)
         
-        with open(BANLIST, 'w') as f:
-            for node_id in main_banlist:
-                f.write(f"{node_id}\n")
+        write_banlist(BANLIST, main_banlist)
         
         print(f"\n✅ BANLISTS GENERATED:")
-        print(f"   banlist_blackhole.txt: {blackhole_banlist}")
-        print(f"   banlist_wormhole.txt: {wormhole_banlist}")
-        print(f"   banlist.txt: {main_banlist}")
+        print(f"   banlist_blackhole.txt: {blackhole_banlist.tolist()}")
+        print(f"   banlist_wormhole.txt: {wormhole_banlist.tolist()}")
+        print(f"   banlist.txt: {main_banlist.tolist()}")
         
     except Exception as e:
         print(f"❌ Error writing banlists: {e}")
@@ -299,8 +366,8 @@ def main():
     print(f"   Scenario: {attack_type.upper()}")
     print(f"   Known Blackholes: {len(known_blackholes)} → Banned: {len(blackhole_banlist)}")
     print(f"   Known Wormholes: {len(known_wormholes)} → Banned: {len(wormhole_banlist)}")
-    print(f"   Total Banned: {len(main_banlist)} nodes")
-    print(f"   Final Ban Ratio: {len(main_banlist)/len(nodes):.1%}")
+    print(f"   Total Banned: {n_bans} nodes")
+    print(f"   Final Ban Ratio: {ban_ratio:.1%}")
     
     return True
 
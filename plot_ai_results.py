@@ -1,222 +1,295 @@
 #!/usr/bin/env python3
-import matplotlib.pyplot as plt
+import argparse
+import contextlib
+import functools
+import io
+import json
+import mmap
 import os
+import re
+import sys
 import numpy as np
 import datetime
 import pandas as pd
-from collections import defaultdict
 
-def calculate_improvement_metrics(data):
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Columns of pdr_results.txt and the value used when a key is missing
+TEXT_COLUMNS = {'Routing': 'UNKNOWN', 'AttackType': 'none', 'Scenario': 'UNKNOWN'}
+INT_COLUMNS = ['Tx', 'Rx', 'Nodes', 'Blackholes', 'Wormholes', 'BannedNodes', 'ActiveFlows']
+FLOAT_COLUMNS = ['PDR', 'Efficiency']
+
+# One "Key=value" token of a results line, matched on the raw bytes
+_KEY_VALUE = re.compile(rb'(\w+)=(\S+)')
+
+# PDR bar colour per (scenario, attack type); '*' matches any other attack type
+BAR_COLORS = {
+    ('BASELINE', '*'): 'green',
+    ('ATTACK', 'blackhole'): 'red',
+    ('ATTACK', 'wormhole'): 'blue',
+    ('ATTACK', '*'): 'orange',
+    ('MITIGATION', 'blackhole'): 'lightcoral',
+    ('MITIGATION', 'wormhole'): 'lightblue',
+    ('MITIGATION', '*'): 'lightgreen'
+}
+
+# Figure, canvas and axes reused by repeated plot_ai_results() calls
+_FIG_CACHE = {}
+
+def _get_skeleton():
+    """Return the figure and its five axes, built once and cleared on reuse"""
+    if not _FIG_CACHE:
+        # matplotlib is only imported once a plot is actually requested
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        # Agg canvas on a plain Figure: no GUI backend probing or pyplot registry.
+        # Constrained layout leaves the bottom 15% free for the summary text.
+        fig = Figure(figsize=(18, 12), layout='constrained')
+        FigureCanvasAgg(fig)
+        fig.get_layout_engine().set(rect=(0, 0.15, 1, 0.85))
+        gs = fig.add_gridspec(3, 3)
+        _FIG_CACHE['fig'] = fig
+        _FIG_CACHE['axes'] = (
+            fig.add_subplot(gs[0, 0:2]),
+            fig.add_subplot(gs[0, 2]),
+            fig.add_subplot(gs[1, 0:2]),
+            fig.add_subplot(gs[1, 2]),
+            fig.add_subplot(gs[2, :])
+        )
+    else:
+        for ax in _FIG_CACHE['axes']:
+            ax.clear()
+            ax.tick_params(reset=True, top=False, right=False)
+        for text in list(_FIG_CACHE['fig'].texts):
+            text.remove()
+    
+    return _FIG_CACHE['fig'], _FIG_CACHE['axes']
+
+@functools.lru_cache(maxsize=None)
+def _legend_elements():
+    """Legend handles for the PDR subplot, built on first use and shared afterwards"""
+    # The legend draws its own copies, so these patches are never attached to an axes
+    from matplotlib.patches import Patch
+    return (
+        Patch(facecolor='green', alpha=0.8, label='Baseline (Normal)'),
+        Patch(facecolor='red', alpha=0.8, label='Blackhole Attack'),
+        Patch(facecolor='blue', alpha=0.8, label='Wormhole Attack'),
+        Patch(facecolor='lightcoral', alpha=0.8, label='Blackhole Mitigation'),
+        Patch(facecolor='lightblue', alpha=0.8, label='Wormhole Mitigation')
+    )
+
+def group_pdr_stats(df):
+    """Mean PDR and run count per attack type (rows) and scenario (columns)"""
+    return (df.dropna(subset=['PDR'])
+              .groupby(['AttackType', 'Scenario'], observed=True, sort=False)['PDR']
+              .agg(['mean', 'count'])
+              .unstack('Scenario'))
+
+def calculate_improvement_metrics(pdr_stats):
     """Calculate improvement metrics across scenarios"""
     metrics = {}
     
-    # Group by attack type and scenario
-    scenarios = defaultdict(list)
-    for entry in data:
-        key = (entry['AttackType'], entry['Scenario'])
-        scenarios[key].append(entry)
+    # Mean PDR per attack type, one column per scenario
+    pdr = pdr_stats['mean'].reindex(columns=['BASELINE', 'ATTACK', 'MITIGATION'])
     
     # Calculate baseline (normal network)
-    baseline_pdr = None
-    for entry in data:
-        if entry['AttackType'] == 'none' and entry['Scenario'] == 'BASELINE':
-            baseline_pdr = entry['PDR']
-            break
-    
-    if baseline_pdr is None:
+    if 'none' not in pdr.index or pd.isna(pdr.at['none', 'BASELINE']):
         print("⚠️  No baseline scenario found")
         return metrics
+    baseline_pdr = pdr.at['none', 'BASELINE']
     
-    # Calculate metrics for each scenario
-    for (attack_type, scenario), entries in scenarios.items():
-        if not entries:
-            continue
-            
-        # Safe average calculation
-        pdrs = [e['PDR'] for e in entries if not np.isnan(e['PDR'])]
-        if not pdrs:
-            continue
-            
-        avg_pdr = np.mean(pdrs)
+    # Calculate metrics for every attack type at once
+    if baseline_pdr > 0:
+        attack_impact = ((baseline_pdr - pdr['ATTACK']) / baseline_pdr * 100).clip(lower=0)
+        recovery_rate = pdr['MITIGATION'] / baseline_pdr * 100
+    else:
+        attack_impact = recovery_rate = pd.Series(0.0, index=pdr.index)
+    mitigation_gain = (pdr['MITIGATION'] - pdr['ATTACK']) / pdr['ATTACK'] * 100
+    
+    for attack_type in pdr.index:
+        attack_pdr = pdr.at[attack_type, 'ATTACK']
+        mitigation_pdr = pdr.at[attack_type, 'MITIGATION']
         
-        if scenario == 'ATTACK':
-            attack_impact = ((baseline_pdr - avg_pdr) / baseline_pdr) * 100 if baseline_pdr > 0 else 0
-            metrics[(attack_type, scenario)] = {
-                'avg_pdr': avg_pdr,
-                'attack_impact': max(0, attack_impact),
+        if not pd.isna(attack_pdr):
+            metrics[(attack_type, 'ATTACK')] = {
+                'avg_pdr': attack_pdr,
+                'attack_impact': attack_impact[attack_type],
                 'recovery_rate': 0
             }
-        elif scenario == 'MITIGATION':
-            # Find corresponding attack PDR
-            attack_pdr = None
-            for (at, sc), e_list in scenarios.items():
-                if at == attack_type and sc == 'ATTACK':
-                    attack_pdrs = [x['PDR'] for x in e_list if not np.isnan(x['PDR'])]
-                    if attack_pdrs:
-                        attack_pdr = np.mean(attack_pdrs)
-                    break
-            
-            if attack_pdr and attack_pdr > 0:
-                mitigation_gain = ((avg_pdr - attack_pdr) / attack_pdr) * 100
-                recovery_rate = (avg_pdr / baseline_pdr) * 100 if baseline_pdr > 0 else 0
-                metrics[(attack_type, scenario)] = {
-                    'avg_pdr': avg_pdr,
-                    'mitigation_gain': mitigation_gain,
-                    'recovery_rate': recovery_rate
-                }
+        
+        if not pd.isna(mitigation_pdr) and attack_pdr > 0:
+            metrics[(attack_type, 'MITIGATION')] = {
+                'avg_pdr': mitigation_pdr,
+                'mitigation_gain': mitigation_gain[attack_type],
+                'recovery_rate': recovery_rate[attack_type]
+            }
     
     return metrics
 
-def plot_ai_results():
-    fn = "scratch/ai_out/pdr_results.txt"
-    
+def parse_results(fn):
+    """Parse the key=value lines of pdr_results.txt into a typed DataFrame"""
+    columns = list(TEXT_COLUMNS) + INT_COLUMNS + FLOAT_COLUMNS
+    records = []
+    with open(fn, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                records = [dict(_KEY_VALUE.findall(line)) for line in iter(mm.readline, b'') if line.strip()]
+    
+    df = pd.DataFrame.from_records(records, columns=[col.encode() for col in columns])
+    df.columns = columns
+    
+    # Decode the raw tokens one column at a time; all-missing columns stay NaN
+    for col in columns:
+        if df[col].dtype == object:
+            df[col] = df[col].str.decode('utf-8')
+    
+    # Only a handful of distinct values repeat across every row
+    for col, default in TEXT_COLUMNS.items():
+        df[col] = df[col].fillna(default).astype('category')
+    
+    # Missing counters default to 0, but a malformed one invalidates the line
+    raw_ints = df[INT_COLUMNS]
+    ints = raw_ints.apply(pd.to_numeric, errors='coerce')
+    # to_numeric would also accept '1.5' or '1e3', which int() rejected
+    is_int = raw_ints.apply(lambda s: s.astype(str).str.fullmatch(r'[+-]?\d+').fillna(False).astype(bool))
+    invalid = raw_ints.notna() & ~is_int
+    for row, col in zip(*np.nonzero(invalid.to_numpy())):
+        print(f"⚠️  Error parsing line: invalid {INT_COLUMNS[col]} value '{raw_ints.iat[row, col]}'")
+    
+    valid_rows = ~invalid.any(axis=1).to_numpy()
+    df = df[valid_rows].reset_index(drop=True)
+    df[INT_COLUMNS] = ints[valid_rows].fillna(0).astype(np.int64).to_numpy()
+    
+    # 'nan' or unparsable ratios count as 0.0
+    df[FLOAT_COLUMNS] = df[FLOAT_COLUMNS].apply(pd.to_numeric, errors='coerce').fillna(0.0)
+    
+    return df
+
+def load_results(fn):
+    """Load pdr_results.txt, through a Parquet cache next to it when pyarrow is available"""
+    if pa is None:
+        return parse_results(fn)
+    
+    # The cache is only trusted if it was written after the text file last changed
+    cache = fn + '.parquet'
+    if os.path.exists(cache) and os.stat(cache).st_mtime_ns > os.stat(fn).st_mtime_ns:
+        try:
+            return pd.read_parquet(cache, engine='pyarrow')
+        except Exception as e:
+            print(f"⚠️  Ignoring unreadable results cache {cache}: {e}")
+    
+    df = parse_results(fn)
+    
+    # Write beside the cache and rename, so an interrupted write never leaves a partial file
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp, cache)
+    except Exception as e:
+        print(f"⚠️  Could not write results cache {cache}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+    return df
+
+def load_valid_results(fn, verbose=True):
+    """Parse the results, log each run and return the rows with a valid PDR, or None"""
     if not os.path.exists(fn):
         print(f"ERROR: Cannot find {fn}")
-        return False
+        return None
 
-    data = []
-    labels = []
-    attacks = []
-    scenarios = []
-    tx_values = []
-    rx_values = []
-    pdr_values = []
-    
     print("📊 Parsing simulation results...")
     
-    with open(fn) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-                
-            try:
-                # Parse the line
-                parts = line.split()
-                data_dict = {}
-                for part in parts:
-                    if '=' in part:
-                        key, value = part.split('=', 1)
-                        data_dict[key] = value
-                
-                routing = data_dict.get('Routing', 'UNKNOWN')
-                attack = data_dict.get('AttackType', 'none')
-                scenario = data_dict.get('Scenario', 'UNKNOWN')
-                tx = int(data_dict.get('Tx', 0))
-                rx = int(data_dict.get('Rx', 0))
-                
-                # Safe PDR calculation
-                pdr_str = data_dict.get('PDR', '0')
-                try:
-                    pdr = float(pdr_str) if pdr_str != 'nan' else 0.0
-                except ValueError:
-                    pdr = 0.0
-                
-                nodes = int(data_dict.get('Nodes', 0))
-                blackholes = int(data_dict.get('Blackholes', 0))
-                wormholes = int(data_dict.get('Wormholes', 0))
-                banned = int(data_dict.get('BannedNodes', 0))
-                
-                # Safe efficiency calculation
-                efficiency_str = data_dict.get('Efficiency', '0')
-                try:
-                    efficiency = float(efficiency_str) if efficiency_str != 'nan' else 0.0
-                except ValueError:
-                    efficiency = 0.0
-                    
-                active_flows = int(data_dict.get('ActiveFlows', 0))
-                
-                # Store data for analysis
-                entry = {
-                    'Routing': routing,
-                    'AttackType': attack,
-                    'Scenario': scenario,
-                    'Tx': tx,
-                    'Rx': rx,
-                    'PDR': pdr,
-                    'Nodes': nodes,
-                    'Blackholes': blackholes,
-                    'Wormholes': wormholes,
-                    'BannedNodes': banned,
-                    'Efficiency': efficiency,
-                    'ActiveFlows': active_flows
-                }
-                data.append(entry)
-                
-                # Create descriptive label
-                label = f"{scenario}\n{attack}"
-                if blackholes > 0:
-                    label += f"\n{blackholes}BH"
-                if wormholes > 0:
-                    label += f"\n{wormholes}WH"
-                if banned > 0:
-                    label += f"\n{banned}Ban"
-                
-                labels.append(label)
-                pdr_values.append(pdr)
-                attacks.append(attack)
-                scenarios.append(scenario)
-                tx_values.append(tx)
-                rx_values.append(rx)
-                
-                print(f"📈 Parsed: {scenario}-{attack} PDR={pdr:.3f} "
-                      f"Tx={tx} Rx={rx} Flows={active_flows}")
-                
-            except (ValueError, KeyError) as e:
-                print(f"⚠️  Error parsing line: {e}")
-                continue
-
-    if not pdr_values:
+    df = load_results(fn)
+    
+    # Create descriptive labels, e.g. "ATTACK\nblackhole\n2BH"
+    df['label'] = df['Scenario'].astype(str).str.cat(df['AttackType'].astype(str), sep='\n')
+    for col, suffix in (('Blackholes', 'BH'), ('Wormholes', 'WH'), ('BannedNodes', 'Ban')):
+        df['label'] += ('\n' + df[col].astype(str) + suffix).where(df[col] > 0, '')
+    
+    parsed_lines = []
+    if verbose:
+        for entry in df.itertuples(index=False):
+            parsed_lines.append(f"📈 Parsed: {entry.Scenario}-{entry.AttackType} PDR={entry.PDR:.3f} "
+                                f"Tx={entry.Tx} Rx={entry.Rx} Flows={entry.ActiveFlows}")
+    
+    if parsed_lines:
+        sys.stdout.write("\n".join(parsed_lines) + "\n")
+    
+    if df.empty:
         print("❌ ERROR: No valid data found")
-        return False
+        return None
 
-    # Filter out NaN values for calculations
-    valid_indices = [i for i, pdr in enumerate(pdr_values) if not np.isnan(pdr)]
-    if not valid_indices:
+    # Filter out NaN values for calculations; every plot reads this one frame
+    valid = df[df['PDR'].notna()].reset_index(drop=True)
+    if valid.empty:
         print("❌ ERROR: No valid PDR values found")
-        return False
+        return None
+    
+    return valid
+
+def _print_summary(df, metrics):
+    """Write the numeric summary of the valid runs to stdout as JSON"""
+    attacks = {}
+    for (attack_type, scenario), values in metrics.items():
+        attacks.setdefault(attack_type, {})[scenario.lower()] = {key: float(value) for key, value in values.items()}
+    
+    summary = {
+        'scenarios': len(df),
+        'avg_pdr': float(df['PDR'].mean()),
+        'std_pdr': float(df['PDR'].std(ddof=0)),
+        'max_pdr': float(df['PDR'].max()),
+        'min_pdr': float(df['PDR'].min()),
+        'total_tx': int(df['Tx'].sum()),
+        'total_rx': int(df['Rx'].sum()),
+        'attacks': attacks
+    }
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+def plot_ai_results(verbose=True, summary_only=False):
+    fn = "scratch/ai_out/pdr_results.txt"
+    
+    if summary_only:
+        # stdout carries only the JSON document; progress and warnings go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            valid = load_valid_results(fn, verbose=False)
+            if valid is None:
+                return False
+            improvement_metrics = calculate_improvement_metrics(group_pdr_stats(valid))
         
-    valid_pdr_values = [pdr_values[i] for i in valid_indices]
-    valid_labels = [labels[i] for i in valid_indices]
-    valid_attacks = [attacks[i] for i in valid_indices]
-    valid_scenarios = [scenarios[i] for i in valid_indices]
-    valid_tx_values = [tx_values[i] for i in valid_indices]
-    valid_rx_values = [rx_values[i] for i in valid_indices]
+        _print_summary(valid, improvement_metrics)
+        return True
+    
+    valid = load_valid_results(fn, verbose)
+    if valid is None:
+        return False
+    
+    total_tx = int(valid['Tx'].sum())
+    total_rx = int(valid['Rx'].sum())
 
     # Calculate improvement metrics
-    improvement_metrics = calculate_improvement_metrics(data)
+    pdr_stats = group_pdr_stats(valid)
+    improvement_metrics = calculate_improvement_metrics(pdr_stats)
     
     # Create enhanced visualization
-    fig = plt.figure(figsize=(18, 12))
+    fig, (ax1, ax2, ax3, ax4, ax5) = _get_skeleton()
     
     # Plot 1: PDR Comparison (Main Results)
-    ax1 = plt.subplot2grid((3, 3), (0, 0), colspan=2)
-    colors = []
-    for attack, scenario in zip(valid_attacks, valid_scenarios):
-        if scenario == 'BASELINE':
-            colors.append('green')
-        elif scenario == 'ATTACK':
-            if attack == 'blackhole':
-                colors.append('red')
-            elif attack == 'wormhole':
-                colors.append('blue')
-            else:
-                colors.append('orange')
-        else:  # MITIGATION
-            if attack == 'blackhole':
-                colors.append('lightcoral')
-            elif attack == 'wormhole':
-                colors.append('lightblue')
-            else:
-                colors.append('lightgreen')
+    # Anything that is not a baseline or attack run is coloured as a mitigation run
+    phases = valid['Scenario'].astype(str).where(valid['Scenario'].isin(['BASELINE', 'ATTACK']), 'MITIGATION')
+    colors = [BAR_COLORS.get((phase, attack), BAR_COLORS[(phase, '*')])
+              for phase, attack in zip(phases, valid['AttackType'])]
     
-    bars = ax1.bar(valid_labels, valid_pdr_values, color=colors, alpha=0.8, edgecolor='black', linewidth=1.2)
+    bars = ax1.bar(valid['label'], valid['PDR'], color=colors, alpha=0.8, edgecolor='black', linewidth=1.2)
     
     # Add value labels on bars
-    for bar, pdr_val in zip(bars, valid_pdr_values):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                f'{pdr_val:.3f}', ha='center', va='bottom', fontweight='bold', fontsize=8)
+    ax1.bar_label(bars, labels=np.char.mod('%.3f', valid['PDR'].to_numpy()),
+                  padding=3, fontweight='bold', fontsize=8)
     
     ax1.set_ylim(0, 1.1)
     ax1.set_ylabel('Packet Delivery Ratio (PDR)', fontsize=12, fontweight='bold')
@@ -226,46 +299,36 @@ def plot_ai_results():
     ax1.tick_params(axis='x', rotation=45, labelsize=8)
     
     # Add legend
-    from matplotlib.patches import Patch
-    legend_elements = [
-        Patch(facecolor='green', alpha=0.8, label='Baseline (Normal)'),
-        Patch(facecolor='red', alpha=0.8, label='Blackhole Attack'),
-        Patch(facecolor='blue', alpha=0.8, label='Wormhole Attack'),
-        Patch(facecolor='lightcoral', alpha=0.8, label='Blackhole Mitigation'),
-        Patch(facecolor='lightblue', alpha=0.8, label='Wormhole Mitigation')
-    ]
-    ax1.legend(handles=legend_elements, loc='upper right', fontsize=9)
+    ax1.legend(handles=_legend_elements(), loc='upper right', fontsize=9)
     
     # Plot 2: Throughput Analysis
-    ax2 = plt.subplot2grid((3, 3), (0, 2))
-    x_pos = np.arange(len(valid_labels))
+    x_pos = np.arange(len(valid))
     width = 0.35
+    throughput_labels = valid['label'].str.replace('\n', ' ')
     
-    ax2.bar(x_pos - width/2, valid_tx_values, width, label='Transmitted', alpha=0.7, color='navy', edgecolor='black')
-    ax2.bar(x_pos + width/2, valid_rx_values, width, label='Received', alpha=0.7, color='limegreen', edgecolor='black')
+    # 2N rectangles: rasterized so vector outputs embed them as one image
+    ax2.bar(x_pos - width/2, valid['Tx'], width, label='Transmitted', alpha=0.7, color='navy', edgecolor='black',
+            rasterized=True)
+    ax2.bar(x_pos + width/2, valid['Rx'], width, label='Received', alpha=0.7, color='limegreen', edgecolor='black',
+            rasterized=True)
     
     ax2.set_xlabel('Scenarios', fontsize=10, fontweight='bold')
     ax2.set_ylabel('Number of Packets', fontsize=10, fontweight='bold')
     ax2.set_title('Packet Throughput Analysis', fontsize=12, fontweight='bold')
     ax2.set_xticks(x_pos)
-    ax2.set_xticklabels([label.replace('\n', ' ') for label in valid_labels], 
-                       rotation=45, ha='right', fontsize=7)
+    ax2.set_xticklabels(throughput_labels, rotation=45, ha='right', fontsize=7)
     ax2.legend(fontsize=9)
     ax2.grid(True, alpha=0.3)
     
     # Plot 3: Packet Loss Analysis
-    ax3 = plt.subplot2grid((3, 3), (1, 0), colspan=2)
-    packet_loss = [tx - rx for tx, rx in zip(valid_tx_values, valid_rx_values)]
-    loss_rates = [loss/tx if tx > 0 else 0 for loss, tx in zip(packet_loss, valid_tx_values)]
+    packet_loss = valid['Tx'] - valid['Rx']
+    loss_rates = np.where(valid['Tx'] > 0, packet_loss / valid['Tx'].clip(lower=1), 0.0)
     
-    loss_bars = ax3.bar(valid_labels, loss_rates, color='red', alpha=0.7, edgecolor='darkred')
+    loss_bars = ax3.bar(valid['label'], loss_rates, color='red', alpha=0.7, edgecolor='darkred')
     
     # Add value labels
-    for bar, loss_rate in zip(loss_bars, loss_rates):
-        if loss_rate > 0:
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height + 0.01,
-                    f'{loss_rate:.1%}', ha='center', va='bottom', fontweight='bold', fontsize=8)
+    ax3.bar_label(loss_bars, labels=np.where(loss_rates > 0, np.char.mod('%.1f%%', loss_rates * 100), ''),
+                  padding=3, fontweight='bold', fontsize=8)
     
     ax3.set_ylabel('Packet Loss Rate', fontsize=10, fontweight='bold')
     ax3.set_title('Packet Loss Analysis by Scenario', fontsize=12, fontweight='bold')
@@ -274,8 +337,6 @@ def plot_ai_results():
     ax3.set_ylim(0, 1.0)
     
     # Plot 4: Improvement Metrics
-    ax4 = plt.subplot2grid((3, 3), (1, 2))
-    
     if improvement_metrics:
         attack_types = []
         attack_impacts = []
@@ -318,17 +379,12 @@ def plot_ai_results():
         ax4.set_title('Improvement Metrics', fontsize=12, fontweight='bold')
     
     # Plot 5: Scenario Efficiency
-    ax5 = plt.subplot2grid((3, 3), (2, 0), colspan=3)
-    
-    efficiencies = [entry.get('Efficiency', 0) for entry in data if not np.isnan(entry.get('Efficiency', 0))]
-    if efficiencies and any(efficiencies):
-        efficiency_labels = [valid_labels[i] for i in range(len(valid_labels)) if not np.isnan(data[i].get('Efficiency', 0))]
-        efficiency_bars = ax5.bar(efficiency_labels, efficiencies, color='purple', alpha=0.7, edgecolor='darkviolet')
+    # Unparsable efficiencies were already read as 0.0, so the PDR mask keeps bars and labels aligned
+    if valid['Efficiency'].any():
+        efficiency_bars = ax5.bar(valid['label'], valid['Efficiency'], color='purple', alpha=0.7, edgecolor='darkviolet')
         
-        for bar, eff in zip(efficiency_bars, efficiencies):
-            height = bar.get_height()
-            ax5.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'{eff:.1f}%', ha='center', va='bottom', fontweight='bold', fontsize=8)
+        ax5.bar_label(efficiency_bars, labels=np.char.mod('%.1f%%', valid['Efficiency'].to_numpy()),
+                      padding=3, fontweight='bold', fontsize=8)
         
         ax5.set_ylabel('Network Efficiency (%)', fontsize=10, fontweight='bold')
         ax5.set_title('Overall Network Efficiency by Scenario', fontsize=12, fontweight='bold')
@@ -339,19 +395,19 @@ def plot_ai_results():
                 ha='center', va='center', transform=ax5.transAxes, fontsize=12)
         ax5.set_title('Network Efficiency', fontsize=12, fontweight='bold')
     
-    # Calculate and display comprehensive statistics
-    avg_pdr = np.mean(valid_pdr_values) if valid_pdr_values else 0
-    max_pdr = np.max(valid_pdr_values) if valid_pdr_values else 0
-    min_pdr = np.min(valid_pdr_values) if valid_pdr_values else 0
-    std_pdr = np.std(valid_pdr_values) if valid_pdr_values else 0
+    # Calculate and display comprehensive statistics (at least one valid PDR is guaranteed above)
+    avg_pdr = valid['PDR'].mean()
+    max_pdr = valid['PDR'].max()
+    min_pdr = valid['PDR'].min()
+    std_pdr = valid['PDR'].std(ddof=0)
     
     # Summary text
     summary_text = f"""EXPERIMENT SUMMARY:
-    • Total Scenarios: {len(valid_pdr_values)}
+    • Total Scenarios: {len(valid)}
     • Average PDR: {avg_pdr:.3f} ± {std_pdr:.3f}
     • Best PDR: {max_pdr:.3f} | Worst PDR: {min_pdr:.3f}
-    • Total Packets: Tx={sum(valid_tx_values):,} | Rx={sum(valid_rx_values):,}
-    • Overall Delivery Rate: {sum(valid_rx_values)/sum(valid_tx_values)*100:.1f}%""" if sum(valid_tx_values) > 0 else "No packet data"
+    • Total Packets: Tx={total_tx:,} | Rx={total_rx:,}
+    • Overall Delivery Rate: {total_rx/total_tx*100:.1f}%""" if total_tx > 0 else "No packet data"
     
     # Add improvement metrics to summary
     if improvement_metrics:
@@ -361,49 +417,57 @@ def plot_ai_results():
             elif scenario == 'MITIGATION' and attack_type != 'none':
                 summary_text += f"\n    • {attack_type.upper()} Mitigation Gain: {metrics['mitigation_gain']:.1f}%"
     
-    plt.figtext(0.02, 0.02, summary_text, fontsize=9, 
-                bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8),
-                fontfamily='monospace')
-    
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.15)
+    fig.text(0.02, 0.02, summary_text, fontsize=9, 
+             bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8),
+             fontfamily='monospace')
     
     # Save with timestamp and latest version
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"scratch/ai_out/ai_manet_analysis_{timestamp}.png"
     
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.savefig("scratch/ai_out/ai_manet_analysis_latest.png", dpi=300, bbox_inches='tight')
+    # The parsed rows are no longer needed; free them before the render peaks
+    del valid
+    
+    # Rasterize once; the timestamped and latest copies are the same image
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=300, bbox_inches='tight')
+    png = buf.getvalue()
+    for path in (output_file, "scratch/ai_out/ai_manet_analysis_latest.png"):
+        with open(path, 'wb') as f:
+            f.write(png)
+    del buf, png
+    
+    # The cached figure outlives this call; a fresh canvas drops the ~78 MB Agg buffer of the 300 dpi render
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    FigureCanvasAgg(fig)
     
     print(f"✅ Enhanced analysis plot saved: {output_file}")
     print(f"📊 Statistical Summary:")
     print(f"   PDR Range: {min_pdr:.3f} - {max_pdr:.3f}")
     print(f"   Average PDR: {avg_pdr:.3f} ± {std_pdr:.3f}")
-    print(f"   Total Packets: {sum(valid_tx_values):,} transmitted, {sum(valid_rx_values):,} received")
+    print(f"   Total Packets: {total_tx:,} transmitted, {total_rx:,} received")
     
     # Detailed analysis by attack type
     print(f"\n📈 DETAILED ANALYSIS BY ATTACK TYPE:")
-    attack_data = defaultdict(list)
-    for entry in data:
-        if not np.isnan(entry['PDR']):
-            attack_data[entry['AttackType']].append(entry)
+    phase_pdr = pdr_stats['mean'].reindex(columns=['ATTACK', 'MITIGATION'])
+    phase_runs = pdr_stats['count'].reindex(columns=['ATTACK', 'MITIGATION']).fillna(0).astype(int)
     
-    for attack_type, entries in attack_data.items():
+    for attack_type in pdr_stats.index:
         if attack_type == 'none':
             continue
             
-        attack_entries = [e for e in entries if e['Scenario'] == 'ATTACK' and not np.isnan(e['PDR'])]
-        mitigation_entries = [e for e in entries if e['Scenario'] == 'MITIGATION' and not np.isnan(e['PDR'])]
+        attack_runs = phase_runs.at[attack_type, 'ATTACK']
+        mitigation_runs = phase_runs.at[attack_type, 'MITIGATION']
         
-        if attack_entries:
-            avg_pdr_attack = np.mean([e['PDR'] for e in attack_entries])
+        if attack_runs:
+            avg_pdr_attack = phase_pdr.at[attack_type, 'ATTACK']
             print(f"   {attack_type.upper()}:")
-            print(f"     Attack PDR: {avg_pdr_attack:.3f} (n={len(attack_entries)})")
+            print(f"     Attack PDR: {avg_pdr_attack:.3f} (n={attack_runs})")
             
-            if mitigation_entries:
-                avg_pdr_mitigation = np.mean([e['PDR'] for e in mitigation_entries])
+            if mitigation_runs:
+                avg_pdr_mitigation = phase_pdr.at[attack_type, 'MITIGATION']
                 improvement = ((avg_pdr_mitigation - avg_pdr_attack) / avg_pdr_attack) * 100
-                print(f"     Mitigation PDR: {avg_pdr_mitigation:.3f} (n={len(mitigation_entries)})")
+                print(f"     Mitigation PDR: {avg_pdr_mitigation:.3f} (n={mitigation_runs})")
                 print(f"     Improvement: {improvement:+.1f}%")
             else:
                 print(f"     Mitigation PDR: No data available")
@@ -413,7 +477,15 @@ def plot_ai_results():
     return True
 
 if __name__ == "__main__":
-    success = plot_ai_results()
+    parser = argparse.ArgumentParser(description="Plot the AI-based MANET security results")
+    parser.add_argument('--summary-only', action='store_true',
+                        help="print the numeric summary as JSON and skip plotting")
+    args = parser.parse_args()
+    
+    success = plot_ai_results(summary_only=args.summary_only)
     if not success:
-        print("❌ Failed to generate enhanced analysis plots")
+        if args.summary_only:
+            print("❌ Failed to generate results summary", file=sys.stderr)
+        else:
+            print("❌ Failed to generate enhanced analysis plots")
         exit(1)